@@ -9,12 +9,149 @@ This script processes all PDFs in the input directory and generates structured J
 To run, navigate to the correct directory (Round 1A Understand..) using `cd` and execute `docker run --rm -v ${PWD}/input:/app/input -v ${PWD}/output:/app/output --network none team_tech_pulse_solution_1:69`.
 """
 
+import contextlib
+import hashlib
+import io
+import json
 import os
+import shutil
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Optional
 from src.process_pdf import PDFProcessor
 
+# PDF processor owned by the current worker process
+_processor = None
+
+def _init_worker():
+    """
+    Initialize the PDF processor once per worker process. 🛠️
+    """
+    global _processor
+    _processor = PDFProcessor()
+
+def _source_digest() -> str:
+    """
+    Hash the extractor source code. 🔐
+
+    Mixed into every cache key so cached outlines are ignored once the code changes.
+
+    Returns:
+        Hex digest of all Python files in the src package.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for source_file in sorted((Path(__file__).parent / "src").glob("*.py")):
+        digest.update(source_file.read_bytes())
+    return digest.hexdigest()
+
+def _cache_key(pdf_file: Path, source_digest: str) -> str:
+    """
+    Compute the cache key of a PDF from its content. 🔑
+
+    Args:
+        pdf_file: Path to the PDF file.
+        source_digest: Digest of the extractor source code.
+
+    Returns:
+        Hex digest identifying the PDF content and extractor version.
+    """
+    digest = hashlib.blake2b(source_digest.encode(), digest_size=16)
+    with open(pdf_file, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _read_cache(cache_file: Path) -> Optional[bytes]:
+    """
+    Read a cached outline, discarding entries that are missing or damaged. 🧐
+
+    Args:
+        cache_file: Path of the cache entry.
+
+    Returns:
+        JSON content of the entry, or None when it has to be regenerated.
+    """
+    try:
+        content = cache_file.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    # An entry cut short by a killed run must not be reused forever
+    try:
+        result = json.loads(content)
+        if isinstance(result, dict) and 'title' in result and 'outline' in result:
+            return content
+    except ValueError:
+        pass
+
+    print(f"🧹 Discarding damaged cache entry: {cache_file.name}")
+    cache_file.unlink(missing_ok=True)
+    return None
+
+def _process_one(pdf_file: Path, output_dir: Path, cache_file: Optional[Path]) -> Path:
+    """
+    Extract the outline of a single PDF in a worker process. 📄
+
+    The messages printed while the file is processed are collected and written as
+    one block once it is done, so the logs of files handled in parallel do not
+    interleave.
+
+    Args:
+        pdf_file: Path to the PDF file to process.
+        output_dir: Directory where the JSON file will be written.
+        cache_file: Path where a copy of the JSON file is cached for later runs, or None
+            when the PDF could not be hashed.
+
+    Returns:
+        Path of the generated JSON file.
+    """
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            return _extract_one(pdf_file, output_dir, cache_file)
+    finally:
+        sys.stdout.write(log.getvalue())
+        sys.stdout.flush()
+
+def _extract_one(pdf_file: Path, output_dir: Path, cache_file: Optional[Path]) -> Path:
+    """
+    Extract the outline of a single PDF and save it as JSON. 📄
+
+    Args:
+        pdf_file: Path to the PDF file to process.
+        output_dir: Directory where the JSON file will be written.
+        cache_file: Path where a copy of the JSON file is cached for later runs, or None
+            when the PDF could not be hashed. Only successful extractions are cached.
+
+    Returns:
+        Path of the generated JSON file.
+    """
+    print(f"\n🔄 Processing: {pdf_file.name}...")
+
+    # Extract outline from PDF
+    result, extracted = _processor.extract_outline_with_status(pdf_file)
+
+    # Create output JSON file
+    output_file = output_dir / f"{pdf_file.stem}.json"
+    _processor.save_result(result, output_file)
+
+    # Keep a copy so the same PDF is not processed again on the next run; the
+    # fallback written after an error is named after the file and may be
+    # transient, so it is never cached
+    if extracted and cache_file is not None:
+        # Copy to a temporary file first and rename it into place, so an
+        # interrupted run never leaves a truncated entry behind
+        temp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(output_file, temp_file)
+            os.replace(temp_file, cache_file)
+        finally:
+            temp_file.unlink(missing_ok=True)
+
+    return output_file
+
 def main():
     """
     Main entry point for PDF processing. 📄➡️📑
@@ -33,10 +170,6 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     print(f"📁 Output directory set to: {output_dir.absolute()}")
 
-    # Initialize PDF processor
-    processor = PDFProcessor()
-    print("🛠️ PDF Processor initialized and ready to go!")
-
     # Get all PDF files from input directory
     pdf_files = list(input_dir.glob("*.pdf"))
 
@@ -48,27 +181,61 @@ def main():
     for pdf_file in pdf_files:
         print(f"  📄 {pdf_file.name}")
 
-    # Process each PDF file
+    # Reuse outlines cached by earlier runs for PDFs whose content is unchanged
+    cache_dir = output_dir / ".cache"
+    cache_dir.mkdir(exist_ok=True)
+    source_digest = _source_digest()
+
     processed_count = 0
+    pending = []
     for pdf_file in pdf_files:
+        # A file that cannot be read here is still handed to a worker without a
+        # cache entry, so one bad input never stops the batch
         try:
-            print(f"\n🔄 Processing: {pdf_file.name}...")
-
-            # Extract outline from PDF
-            result = processor.extract_outline(pdf_file)
-
-            # Create output JSON file
-            output_file = output_dir / f"{pdf_file.stem}.json"
-            processor.save_result(result, output_file)
-
-            print(f"✅ Successfully generated: {output_file.name}!")
-            processed_count += 1
-
+            cache_file = cache_dir / f"{_cache_key(pdf_file, source_digest)}.json"
         except Exception as e:
             print(f"❌ Error processing {pdf_file.name}: {str(e)}")
-            # Continue processing other files
+            pending.append((pdf_file, None))
             continue
 
+        output_file = output_dir / f"{pdf_file.stem}.json"
+        try:
+            cached = _read_cache(cache_file)
+            if cached is not None:
+                output_file.write_bytes(cached)
+        except Exception as e:
+            print(f"❌ Error processing {pdf_file.name}: {str(e)}")
+            cached = None
+
+        if cached is not None:
+            print(f"♻️ Reused cached outline: {output_file.name}")
+            processed_count += 1
+        else:
+            pending.append((pdf_file, cache_file))
+
+    # Process PDF files in parallel; every file is independent, and worker
+    # processes sidestep the GIL held during the regex-heavy analysis
+    if pending:
+        max_workers = min(os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            print(f"🛠️ PDF Processor pool started with {max_workers} worker(s)!")
+            futures = {
+                executor.submit(_process_one, pdf_file, output_dir, cache_file): pdf_file
+                for pdf_file, cache_file in pending
+            }
+
+            for future in as_completed(futures):
+                pdf_file = futures[future]
+                try:
+                    output_file = future.result()
+                    print(f"✅ Successfully generated: {output_file.name}!")
+                    processed_count += 1
+
+                except Exception as e:
+                    print(f"❌ Error processing {pdf_file.name}: {str(e)}")
+                    # Continue processing other files
+                    continue
+
     # Summary
     total_time = time.time() - start_time
     print(f"\n{'=' * 50}")
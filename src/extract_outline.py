@@ -7,58 +7,122 @@ It employs a combination of font analysis and pattern matching to identify docum
 """
 
 import re
-from typing import Dict, List, Any, Optional
-
-# Assuming these utility classes are defined elsewhere
-from src.utility import FontAnalyzer, TextProcessor
+from functools import cached_property
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+# Pages with at least this many text lines run the font size threshold test
+# as a single vectorised NumPy operation
+_NUMPY_MIN_LINES = 256
+
+# NumPy module, or None when it is not installed; imported on first use since
+# only dense pages need it and the import is a large share of startup time
+_np = None
+_np_loaded = False
+
+def _load_numpy():
+    """
+    Import NumPy on first use.
+
+    Returns:
+        The numpy module, or None when it is not installed.
+    """
+    global _np, _np_loaded
+    if not _np_loaded:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+        _np_loaded = True
+    return _np
+
+# Define heading detection patterns for various heading styles.
+# Each entry is (group name, pattern); patterns capturing the heading text
+# expose it through a nested "<name>_text" group.
+_ENGLISH_HEADING_PATTERNS = [
+    ('num1', r'\d+\.\s+(?P<num1_text>.+)$'),          # Matches numbered headings like "1. Introduction"
+    ('num2', r'\d+\.\d+\s+(?P<num2_text>.+)$'),       # Matches sub-numbered headings like "1.1 Overview"
+    ('num3', r'\d+\.\d+\.\d+\s+(?P<num3_text>.+)$'),  # Matches deeper sub-numbered headings like "1.1.1 Details"
+    ('caps', r'[A-Z][A-Z\s]+$'),                      # Matches headings in ALL CAPS
+    ('roman', r'[IVX]+\.\s+(?P<roman_text>.+)$'),     # Matches headings with Roman numerals like "IV. Section"
+    ('letter', r'[A-Z]\.\s+(?P<letter_text>.+)$'),    # Matches headings like "A. Section"
+    ('paren', r'\([a-z]\)\s+(?P<paren_text>.+)$'),    # Matches headings like "(a) subsection"
+    ('bullet', r'•\s+(?P<bullet_text>.+)$'),          # Matches bullet point headings
+    ('dash', r'-\s+(?P<dash_text>.+)$'),              # Matches dash headings
+]
+
+# Heading candidates as parallel lists of texts, confidence scores and font
+# sizes (None when the detection strategy does not know the font size)
+Candidates = Tuple[List[str], List[float], List[Optional[float]]]
+
+# Pattern groups whose match always begins with a digit
+_NUMBERED_GROUPS = frozenset({'num1', 'num2', 'num3'})
+
+# Alternatives are tried in order, so a single match call picks the same
+# pattern the first successful entry of the list above would
+HEADING_PATTERNS = {
+    'english': re.compile(
+        '^(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _ENGLISH_HEADING_PATTERNS) + ')'
+    ),
+    # Multilingual feature in code
+    'multilingual': re.compile(
+        '^['
+        '\u4e00-\u9fff'    # Chinese/Japanese
+        '\u3040-\u309f'    # Hiragana
+        '\u30a0-\u30ff'    # Katakana
+        '\u0590-\u05ff'    # Hebrew
+        '\u0600-\u06ff'    # Arabic
+        '\u0900-\u097F'    # Devanagari (Hindi, Marathi, Sanskrit, etc.)
+        '\u0980-\u09FF'    # Bengali (Bangla, Assamese)
+        '\u0A00-\u0A7F'    # Gurmukhi (Punjabi)
+        '\u0A80-\u0AFF'    # Gujarati
+        '\u0B00-\u0B7F'    # Oriya (Odia)
+        '\u0B80-\u0BFF'    # Tamil
+        '\u0C00-\u0C7F'    # Telugu
+        '\u0C80-\u0CFF'    # Kannada
+        '\u0D00-\u0D7F'    # Malayalam
+        '\u0E00-\u0E7F'    # Thai
+        '\u0E80-\u0EFF'    # Lao
+        '\u1100-\u11FF'    # Hangul Jamo (Korean)
+        '\uAC00-\uD7AF'    # Hangul Syllables (Korean)
+        '\u0400-\u04FF'    # Cyrillic (Russian, Ukrainian, etc.)
+        '\u0370-\u03FF'    # Greek
+        ']+'
+    ),
+}
+
+# Very common words that lower a span's title score
+_COMMON_WORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+# Words that rule out a span as the document title
+_NON_TITLE_RE = re.compile(r'page|abstract|introduction|contents|index')
+
+# Explicit numbering patterns used to determine heading levels
+_NUM_H1 = re.compile(r'^\d+\.\s+')
+_NUM_H2 = re.compile(r'^\d+\.\d+\s+')
+_NUM_H3 = re.compile(r'^\d+\.\d+\.\d+\s+')
 
 class OutlineExtractor:
     """Extracts structured outlines from PDF content using multiple strategies."""
 
     def __init__(self):
         """Initialize the outline extractor with necessary tools and patterns."""
-        self.font_analyzer = FontAnalyzer()
-        self.text_processor = TextProcessor()
-
-        # Define heading detection patterns for various heading styles
-        self.heading_patterns = {
-        'english': [
-            r'^\d+\.\s+(.+)$',       # Matches numbered headings like "1. Introduction"
-            r'^\d+\.\d+\s+(.+)$',    # Matches sub-numbered headings like "1.1 Overview"
-            r'^\d+\.\d+\.\d+\s+(.+)$', # Matches deeper sub-numbered headings like "1.1.1 Details"
-            r'^[A-Z][A-Z\s]+$',      # Matches headings in ALL CAPS
-            r'^[IVX]+\.\s+(.+)$',    # Matches headings with Roman numerals like "IV. Section"
-            r'^[A-Z]\.\s+(.+)$',     # Matches headings like "A. Section"
-            r'^\([a-z]\)\s+(.+)$',   # Matches headings like "(a) subsection"
-            r'^•\s+(.+)$',           # Matches bullet point headings
-            r'^-\s+(.+)$',           # Matches dash headings
-        ],
-        # Multilingual feature in code
-        'multilingual': [
-        r'^[\u4e00-\u9fff]+',    # Chinese/Japanese
-        r'^[\u3040-\u309f]+',    # Hiragana
-        r'^[\u30a0-\u30ff]+',    # Katakana
-        r'^[\u0590-\u05ff]+',    # Hebrew
-        r'^[\u0600-\u06ff]+',    # Arabic
-        r'^[\u0900-\u097F]+',    # Devanagari (Hindi, Marathi, Sanskrit, etc.)
-        r'^[\u0980-\u09FF]+',    # Bengali (Bangla, Assamese)
-        r'^[\u0A00-\u0A7F]+',    # Gurmukhi (Punjabi)
-        r'^[\u0A80-\u0AFF]+',    # Gujarati
-        r'^[\u0B00-\u0B7F]+',    # Oriya (Odia)
-        r'^[\u0B80-\u0BFF]+',    # Tamil
-        r'^[\u0C00-\u0C7F]+',    # Telugu
-        r'^[\u0C80-\u0CFF]+',    # Kannada
-        r'^[\u0D00-\u0D7F]+',    # Malayalam
-        r'^[\u0E00-\u0E7F]+',    # Thai
-        r'^[\u0E80-\u0EFF]+',    # Lao
-        r'^[\u1100-\u11FF]+',    # Hangul Jamo (Korean)
-        r'^[\uAC00-\uD7AF]+',    # Hangul Syllables (Korean)
-        r'^[\u0400-\u04FF]+',    # Cyrillic (Russian, Ukrainian, etc.)
-        r'^[\u0370-\u03FF]+',    # Greek
-    ]
-      }
-
-    def extract_title(self, metadata: Dict, pages_content: List[Dict]) -> str:
+        # Heading detection patterns are compiled once at import time
+        self.heading_patterns = HEADING_PATTERNS
+
+    @cached_property
+    def font_analyzer(self):
+        """Font analyzer, created on first use since extraction does not need it."""
+        from src.utility import FontAnalyzer
+        return FontAnalyzer()
+
+    @cached_property
+    def text_processor(self):
+        """Text processor, created on first use since extraction does not need it."""
+        from src.utility import TextProcessor
+        return TextProcessor()
+
+    def extract_title(self, metadata: Dict, pages_content: Iterable[Dict]) -> str:
         """
         Extract document title using multiple strategies.
 
@@ -67,7 +131,7 @@ class OutlineExtractor:
 
         Args:
             metadata: PDF metadata dictionary which may contain the title.
-            pages_content: List of page content dictionaries to analyze for potential titles.
+            pages_content: Iterable of page content dictionaries; only the first page is consumed.
 
         Returns:
             Extracted title string.
@@ -80,8 +144,8 @@ class OutlineExtractor:
                 return title
 
         # Strategy 2: Extract from first page using font analysis
-        if pages_content:
-            first_page = pages_content[0]
+        first_page = next(iter(pages_content), None)
+        if first_page:
             title = self._extract_title_from_page(first_page)
             if title:
                 print(f"Title extracted from first page: {title}")
@@ -130,11 +194,12 @@ class OutlineExtractor:
                         continue
 
                     # Skip common non-title patterns
-                    if any(pattern in text.lower() for pattern in ['page', 'abstract', 'introduction', 'contents', 'index']):
+                    text_lower = text.lower()
+                    if _NON_TITLE_RE.search(text_lower):
                         continue
 
                     # Calculate title score based on font characteristics
-                    score = self._calculate_title_score(text, font_size, font_flags)
+                    score = self._calculate_title_score(text, text_lower, font_size, font_flags)
 
                     if score > 0:
                         candidates.append((text, score, font_size))
@@ -146,7 +211,7 @@ class OutlineExtractor:
 
         return None
 
-    def _calculate_title_score(self, text: str, font_size: float, font_flags: int) -> float:
+    def _calculate_title_score(self, text: str, text_lower: str, font_size: float, font_flags: int) -> float:
         """
         Calculate a likelihood score for text being a title.
 
@@ -155,6 +220,7 @@ class OutlineExtractor:
 
         Args:
             text: The text to evaluate.
+            text_lower: Lowercased copy of the text.
             font_size: The font size of the text.
             font_flags: The font flags indicating style attributes like bold or italic.
 
@@ -189,14 +255,13 @@ class OutlineExtractor:
             score += 0.5
 
         # Penalty for very common words
-        common_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        text_words = set(text.lower().split())
-        if len(text_words.intersection(common_words)) > len(text_words) * 0.5:
+        text_words = set(text_lower.split())
+        if len(text_words.intersection(_COMMON_WORDS)) > len(text_words) * 0.5:
             score -= 0.5
 
         return score
 
-    def extract_headings(self, pages_content: List[Dict]) -> List[Dict[str, Any]]:
+    def extract_headings(self, pages_content: Iterable[Dict]) -> List[Dict[str, Any]]:
         """
         Extract hierarchical headings from all pages.
 
@@ -204,29 +269,36 @@ class OutlineExtractor:
         post-processes them to assign proper hierarchy levels.
 
         Args:
-            pages_content: List of page content dictionaries.
+            pages_content: Iterable of page content dictionaries, consumed once.
 
         Returns:
             List of heading dictionaries with level, text, and page number.
         """
-        headings = []
+        # Candidates are kept as parallel lists (text, confidence, font size,
+        # page) so no per-candidate dictionary is built before the final output
+        texts = []
+        confidences = []
+        font_sizes = []
+        pages = []
 
         for page_content in pages_content:
             page_num = page_content['page_num']
-            page_headings = self._extract_headings_from_page(page_content)
+            page_texts, page_confidences, page_font_sizes = self._extract_headings_from_page(page_content)
+
+            texts.extend(page_texts)
+            confidences.extend(page_confidences)
+            font_sizes.extend(page_font_sizes)
 
             # Add page number to each heading
-            for heading in page_headings:
-                heading['page'] = page_num
-                headings.append(heading)
+            pages.extend([page_num] * len(page_texts))
 
         # Post-process headings to assign proper hierarchy levels
-        processed_headings = self._process_heading_hierarchy(headings)
+        processed_headings = self._process_heading_hierarchy(texts, confidences, font_sizes, pages)
 
         print(f"Extracted {len(processed_headings)} headings")
         return processed_headings
 
-    def _extract_headings_from_page(self, page_content: Dict) -> List[Dict[str, Any]]:
+    def _extract_headings_from_page(self, page_content: Dict) -> Candidates:
         """
         Extract potential headings from a single page.
 
@@ -236,64 +308,52 @@ class OutlineExtractor:
             page_content: Dictionary containing the content of a single page.
 
         Returns:
-            List of heading dictionaries with text and confidence scores.
+            Parallel lists of heading texts, confidence scores and font sizes.
         """
         text_dict = page_content.get('text_dict', {})
-        plain_text = page_content.get('plain_text', '')
 
-        candidates = []
+        # Walk the page's spans once; both strategies share the line summaries
+        lines, avg_size = self._flatten_lines(text_dict)
 
         # Strategy 1: Font-based detection
-        font_candidates = self._extract_by_font_analysis(text_dict)
-        candidates.extend(font_candidates)
+        texts, confidences, font_sizes = self._extract_by_font_analysis(lines, avg_size)
 
-        # Strategy 2: Pattern-based detection
-        pattern_candidates = self._extract_by_patterns(plain_text)
-        candidates.extend(pattern_candidates)
+        # Strategy 2: Pattern-based detection (font size unknown)
+        pattern_texts, pattern_confidences = self._extract_by_patterns(lines)
+        texts.extend(pattern_texts)
+        confidences.extend(pattern_confidences)
+        font_sizes.extend([None] * len(pattern_texts))
 
         # Remove duplicates and sort by confidence
-        unique_candidates = self._deduplicate_candidates(candidates)
+        order = self._deduplicate_candidates(texts, confidences)
 
-        return unique_candidates
+        return (
+            [texts[i] for i in order],
+            [confidences[i] for i in order],
+            [font_sizes[i] for i in order]
+        )
 
-    def _extract_by_font_analysis(self, text_dict: Dict) -> List[Dict[str, Any]]:
+    def _flatten_lines(self, text_dict: Dict) -> Tuple[List[Tuple[str, float, int]], Optional[float]]:
         """
-        Extract headings based on font characteristics.
+        Flatten a page's text dictionary into per-line summaries.
 
-        This method identifies potential headings by analyzing font sizes and styles.
+        This method combines the spans of every line and accumulates the page's average
+        font size in the same pass, so the nested dictionaries are traversed only once.
 
         Args:
             text_dict: Dictionary containing text blocks and their properties.
 
         Returns:
-            List of heading dictionaries with text, confidence scores, and other attributes.
+            Tuple of the (text, font size, font flags) summary of each line and the average
+            font size of the page, or None if no span has a font size.
         """
-        candidates = []
+        lines = []
+        total_size = 0.0
+        size_count = 0
 
         if not text_dict or 'blocks' not in text_dict:
-            return candidates
-
-        # Collect all font sizes to determine relative sizes
-        font_sizes = []
-        for block in text_dict['blocks']:
-            if 'lines' not in block:
-                continue
-            for line in block['lines']:
-                if 'spans' not in line:
-                    continue
-                for span in line['spans']:
-                    size = span.get('size', 0)
-                    if size > 0:
-                        font_sizes.append(size)
-
-        if not font_sizes:
-            return candidates
-
-        # Calculate font size thresholds
-        avg_size = sum(font_sizes) / len(font_sizes)
-        max_size = max(font_sizes)
+            return lines, None
 
-        # Extract text with larger fonts as potential headings
         for block in text_dict['blocks']:
             if 'lines' not in block:
                 continue
@@ -308,108 +368,137 @@ class OutlineExtractor:
                 line_flags = 0
 
                 for span in line['spans']:
+                    size = span.get('size', 0)
+                    if size > 0:
+                        total_size += size
+                        size_count += 1
+
                     line_text += span.get('text', '')
-                    line_size = max(line_size, span.get('size', 0))
+                    line_size = max(line_size, size)
                     line_flags |= span.get('flags', 0)
 
-                line_text = line_text.strip()
+                lines.append((line_text.strip(), line_size, line_flags))
 
-                # Skip empty lines or very short text
-                if not line_text or len(line_text) < 3:
-                    continue
+        avg_size = total_size / size_count if size_count else None
 
-                # Check if this could be a heading based on font size
-                size_ratio = line_size / avg_size if avg_size > 0 else 1
+        return lines, avg_size
 
-                if size_ratio >= 1.2 or line_size >= avg_size + 2:
-                    confidence = min(size_ratio, 3.0)
+    def _extract_by_font_analysis(self, lines: List[Tuple[str, float, int]], avg_size: Optional[float]) -> Candidates:
+        """
+        Extract headings based on font characteristics.
+
+        This method identifies potential headings by analyzing font sizes and styles.
+
+        Args:
+            lines: Summaries (text, font size, font flags) of the page's lines.
+            avg_size: Average font size of the page, or None if unknown.
 
-                    # Boost confidence for bold text
-                    if line_flags & 2**4:  # Bold
-                        confidence += 0.5
+        Returns:
+            Parallel lists of heading texts, confidence scores and font sizes.
+        """
+        texts = []
+        confidences = []
+        font_sizes = []
 
-                    candidates.append({
-                        'text': line_text,
-                        'confidence': confidence,
-                        'font_size': line_size,
-                        'method': 'font_analysis'
-                    })
+        if not avg_size:
+            return texts, confidences, font_sizes
 
-        return candidates
+        np = _load_numpy() if len(lines) >= _NUMPY_MIN_LINES else None
+        if np is not None:
+            # Dense page: pre-filter all lines by size in one vectorised pass
+            sizes = np.fromiter((line[1] for line in lines), dtype=np.float64, count=len(lines))
+            is_large = (sizes / avg_size >= 1.2) | (sizes >= avg_size + 2)
+            lines = [lines[i] for i in np.flatnonzero(is_large)]
 
-    def _extract_by_patterns(self, plain_text: str) -> List[Dict[str, Any]]:
+        # Extract text with larger fonts as potential headings
+        for line_text, line_size, line_flags in lines:
+            # Skip empty lines or very short text
+            if len(line_text) < 3:
+                continue
+
+            # Check if this could be a heading based on font size
+            size_ratio = line_size / avg_size
+
+            if size_ratio >= 1.2 or line_size >= avg_size + 2:
+                confidence = min(size_ratio, 3.0)
+
+                # Boost confidence for bold text
+                if line_flags & 2**4:  # Bold
+                    confidence += 0.5
+
+                texts.append(line_text)
+                confidences.append(confidence)
+                font_sizes.append(line_size)
+
+        return texts, confidences, font_sizes
+
+    def _extract_by_patterns(self, lines: List[Tuple[str, float, int]]) -> Tuple[List[str], List[float]]:
         """
         Extract headings based on text patterns.
 
         This method identifies potential headings by matching text against predefined patterns.
 
         Args:
-            plain_text: Plain text content of a page.
+            lines: Summaries (text, font size, font flags) of the page's lines.
 
         Returns:
-            List of heading dictionaries with text, confidence scores, and other attributes.
+            Parallel lists of heading texts and confidence scores.
         """
-        candidates = []
+        texts = []
+        confidences = []
 
-        lines = plain_text.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line or len(line) < 3:
+        for line, _, _ in lines:
+            if len(line) < 3:
                 continue
 
-            # Test against heading patterns
-            for lang, patterns in self.heading_patterns.items():
-              for pattern in patterns:
-                match = re.match(pattern, line)
+            # Test against heading patterns; every multilingual range is
+            # outside ASCII, so pure ASCII lines can skip that pattern
+            is_ascii = line.isascii()
+            for lang, pattern in self.heading_patterns.items():
+                if is_ascii and lang == 'multilingual':
+                    continue
+
+                match = pattern.match(line)
                 if match:
                     # Extract the heading text (removing numbering)
-                    if match.groups():
-                        heading_text = match.group(1).strip()
+                    name = match.lastgroup
+                    text_group = f'{name}_text'
+                    if text_group in pattern.groupindex:
+                        heading_text = match.group(text_group).strip()
                     else:
                         heading_text = line.strip()
 
                     if heading_text and len(heading_text) >= 3:
                         confidence = 1.0
 
-                        # Boost confidence for numbered patterns
-                        if any(char.isdigit() for char in line[:10]):
+                        # Boost confidence for numbered patterns; the numbered
+                        # groups start with a digit by construction
+                        if name in _NUMBERED_GROUPS or any(map(str.isdigit, line[:10])):
                             confidence += 0.5
 
-                        candidates.append({
-                            'text': heading_text,
-                            'confidence': confidence,
-                            'pattern': pattern,
-                            'method': 'pattern_matching'
-                        })
-                    break
+                        texts.append(heading_text)
+                        confidences.append(confidence)
 
-        return candidates
+        return texts, confidences
 
-    def _deduplicate_candidates(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _deduplicate_candidates(self, texts: List[str], confidences: List[float]) -> List[int]:
         """
         Remove duplicate candidates and sort by confidence.
 
         This method ensures that only unique headings are retained and sorted by confidence.
 
         Args:
-            candidates: List of heading dictionaries.
+            texts: Candidate heading texts.
+            confidences: Confidence score of each candidate.
 
         Returns:
-            List of unique heading dictionaries sorted by confidence.
+            Indices of the unique candidates sorted by confidence.
         """
-        seen_texts = set()
-        unique_candidates = []
-
-        # Sort by confidence (highest first)
-        candidates.sort(key=lambda x: x.get('confidence', 0), reverse=True)
+        # Keep the most confident candidate per text in a single pass
+        best = {}
 
-        for candidate in candidates:
-            text = candidate['text'].lower().strip()
-
-            # Skip if we've seen similar text
-            if text in seen_texts:
-                continue
+        for index, text in enumerate(texts):
+            text = text.lower().strip()
 
             # Skip very short headings
             if len(text) < 3:
@@ -419,48 +508,65 @@ class OutlineExtractor:
             if len(text) > 200:
                 continue
 
-            seen_texts.add(text)
-            unique_candidates.append(candidate)
+            current = best.get(text)
+            if current is None or confidences[index] > confidences[current]:
+                best[text] = index
 
-        return unique_candidates
+        # Sort only the unique survivors by confidence (highest first); the
+        # original position breaks ties like a stable sort would
+        return sorted(best.values(), key=lambda i: (-confidences[i], i))
 
-    def _process_heading_hierarchy(self, headings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _process_heading_hierarchy(self, texts: List[str], confidences: List[float],
+                                   font_sizes: List[Optional[float]], pages: List[int]) -> List[Dict[str, Any]]:
         """
         Process headings to assign proper hierarchy levels (H1, H2, H3).
 
         This method assigns hierarchy levels to headings based on font sizes and patterns.
 
         Args:
-            headings: List of heading dictionaries.
+            texts: Heading texts.
+            confidences: Confidence score of each heading.
+            font_sizes: Font size of each heading, or None if unknown.
+            pages: Page number of each heading.
 
         Returns:
             List of heading dictionaries with assigned hierarchy levels.
         """
-        if not headings:
+        if not texts:
             return []
 
         # Sort headings by confidence and font size
-        sorted_headings = sorted(headings, key=lambda x: (
-            x.get('confidence', 0),
-            x.get('font_size', 0)
+        order = sorted(range(len(texts)), key=lambda i: (
+            confidences[i],
+            font_sizes[i] or 0
         ), reverse=True)
 
-        # Assign hierarchy levels based on font sizes and patterns
-        processed = []
-        font_size_to_level = {}
+        # Headings without a known font size are treated as body-sized text
+        level_sizes = [12 if size is None else size for size in font_sizes]
 
-        for heading in sorted_headings:
-            text = heading['text']
-            font_size = heading.get('font_size', 12)
-            page = heading['page']
+        # Explicit numbering decides the level first; the remaining headings
+        # are ranked by font size
+        numbering_levels = [self._get_numbering_level(texts[i]) for i in order]
 
-            # Determine hierarchy level
-            level = self._determine_heading_level(text, font_size, font_size_to_level)
+        # Rank the distinct font sizes once: largest is H1, next is H2, the rest H3
+        distinct_sizes = sorted({
+            level_sizes[i]
+            for i, numbering_level in zip(order, numbering_levels)
+            if numbering_level is None
+        }, reverse=True)
+        font_size_to_level = {
+            size: ('H1', 'H2', 'H3')[min(rank, 2)]
+            for rank, size in enumerate(distinct_sizes)
+        }
 
+        # Assign hierarchy levels based on font sizes and patterns
+        processed = []
+
+        for i, numbering_level in zip(order, numbering_levels):
             processed.append({
-                'level': level,
-                'text': text,
-                'page': page
+                'level': numbering_level or font_size_to_level[level_sizes[i]],
+                'text': texts[i],
+                'page': pages[i]
             })
 
         # Sort by page number to maintain document order
@@ -468,66 +574,21 @@ class OutlineExtractor:
 
         return processed
 
-    def _determine_heading_level(self, text: str, font_size: float, font_size_to_level: Dict[float, str]) -> str:
+    def _get_numbering_level(self, text: str) -> Optional[str]:
         """
-        Determine the hierarchy level (H1, H2, H3) for a heading.
-
-        This method assigns a hierarchy level based on text patterns and font sizes.
+        Determine the hierarchy level (H1, H2, H3) implied by explicit numbering.
 
         Args:
             text: The heading text.
-            font_size: The font size of the heading.
-            font_size_to_level: Dictionary mapping font sizes to hierarchy levels.
 
         Returns:
-            A string representing the hierarchy level (H1, H2, H3).
+            A string representing the hierarchy level, or None if the text is not numbered.
         """
-        # Check for explicit numbering patterns
-        if re.match(r'^\d+\.\s+', text):
+        if _NUM_H1.match(text):
             return 'H1'
-        elif re.match(r'^\d+\.\d+\s+', text):
+        elif _NUM_H2.match(text):
             return 'H2'
-        elif re.match(r'^\d+\.\d+\.\d+\s+', text):
+        elif _NUM_H3.match(text):
             return 'H3'
 
-        # Use font size mapping
-        if font_size in font_size_to_level:
-            return font_size_to_level[font_size]
-
-        # Assign level based on relative font size
-        existing_sizes = sorted(font_size_to_level.keys(), reverse=True)
-
-        if not existing_sizes:
-            # First heading - assign H1
-            font_size_to_level[font_size] = 'H1'
-            return 'H1'
-
-        # Compare with existing font sizes
-        if font_size > existing_sizes[0]:
-            # Larger than existing - this is H1, demote others
-            new_mapping = {font_size: 'H1'}
-            for size in existing_sizes:
-                current_level = font_size_to_level[size]
-                if current_level == 'H1':
-                    new_mapping[size] = 'H2'
-                elif current_level == 'H2':
-                    new_mapping[size] = 'H3'
-                else:
-                    new_mapping[size] = 'H3'
-            font_size_to_level.update(new_mapping)
-            return 'H1'
-
-        elif font_size >= existing_sizes[0]:
-            # Same as largest - also H1
-            font_size_to_level[font_size] = 'H1'
-            return 'H1'
-
-        elif len(existing_sizes) == 1:
-            # Second font size - assign H2
-            font_size_to_level[font_size] = 'H2'
-            return 'H2'
-
-        else:
-            # Third or smaller font size - assign H3
-            font_size_to_level[font_size] = 'H3'
-            return 'H3'
+        return None
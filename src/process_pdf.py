@@ -6,10 +6,17 @@ This module is responsible for processing PDF files to extract structured outlin
 It coordinates the extraction process and handles saving the results to JSON files.
 """
 
+import itertools
 import json
 import fitz  # PyMuPDF
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterator, List, Any, Tuple
+
+try:
+    # orjson serializes straight to UTF-8 bytes and is much faster than json
+    import orjson
+except ImportError:
+    orjson = None
 
 # Assuming OutlineExtractor is defined in src.extract_outline
 from src.extract_outline import OutlineExtractor
@@ -47,40 +54,48 @@ class PDFProcessor:
         Returns:
             Dictionary containing the title and outline structure of the document.
         """
-        try:
-            # Open the PDF document using PyMuPDF
-            doc = fitz.open(pdf_path)
-
-            # Extract document metadata and count the number of pages
-            metadata = doc.metadata
-            page_count = len(doc)
+        result, _ = self.extract_outline_with_status(pdf_path)
+        return result
 
-            print(f"Document info: {page_count} pages")
-
-            # Extract text content from all pages
-            pages_content = []
-            for page_num in range(page_count):
-                page = doc[page_num]
+    def extract_outline_with_status(self, pdf_path: Path) -> Tuple[Dict[str, Any], bool]:
+        """
+        Extract structured outline from a PDF file, reporting whether extraction succeeded.
 
-                # Extract text with font information as a dictionary
-                text_dict = page.get_text("dict")
-                pages_content.append({
-                    'page_num': page_num + 1,
-                    'text_dict': text_dict,
-                    'plain_text': page.get_text()
-                })
+        On failure the result is the default structure derived from the file name, which
+        must not be reused for other files with the same content.
 
-            # Close the document after processing
-            doc.close()
+        Args:
+            pdf_path: Path to the PDF file.
 
-            # Extract title and outline using the specialized extractor
-            title = self.outline_extractor.extract_title(metadata, pages_content)
-            outline = self.outline_extractor.extract_headings(pages_content)
+        Returns:
+            Tuple containing the title and outline dictionary and a boolean that is False
+            when the default structure was returned because of an error.
+        """
+        try:
+            # Open the PDF document using PyMuPDF; opening by path lets MuPDF
+            # read the file on demand, and the context manager closes it even
+            # when extraction fails
+            with fitz.open(pdf_path) as doc:
+                # Extract document metadata and count the number of pages
+                metadata = doc.metadata
+                page_count = len(doc)
+
+                print(f"Document info: {page_count} pages")
+
+                # Stream pages lazily so only one page's text is held at a time;
+                # the title only needs the first page, which tee buffers for the
+                # heading pass
+                title_pages, heading_pages = itertools.tee(self._iter_pages(doc))
+
+                # Extract title and outline using the specialized extractor
+                title = self.outline_extractor.extract_title(metadata, title_pages)
+                del title_pages  # Otherwise tee keeps buffering every page behind it
+                outline = self.outline_extractor.extract_headings(heading_pages)
 
             return {
                 "title": title,
                 "outline": outline
-            }
+            }, True
 
         except Exception as e:
             print(f"Error processing PDF {pdf_path}: {str(e)}")
@@ -88,6 +103,29 @@ class PDFProcessor:
             return {
                 "title": pdf_path.stem.replace('_', ' ').title(),
                 "outline": []
+            }, False
+
+    def _iter_pages(self, doc: fitz.Document) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the text content of each page of an open document.
+
+        Args:
+            doc: Open PyMuPDF document.
+
+        Yields:
+            Page content dictionaries with page number and text dictionary.
+        """
+        # Pages are read serially on purpose: PyMuPDF is not thread-safe and
+        # keeps the GIL during extraction, so a thread pool would not overlap
+        # any work. Parallelism happens across files instead (see main.py).
+        for page_num in range(len(doc)):
+            page = doc[page_num]
+
+            # Extract text with font information as a dictionary; the pattern
+            # matching reuses its lines, so the page is parsed only once
+            yield {
+                'page_num': page_num + 1,
+                'text_dict': page.get_text("dict")
             }
 
     def save_result(self, result: Dict[str, Any], output_path: Path) -> None:
@@ -116,8 +154,12 @@ class PDFProcessor:
                     print(f" ... and {len(errors) - 3} more warning(s)")
 
             # Save the JSON file with the result
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, indent=2, ensure_ascii=False)
 
             if is_valid:
                 print(f"{colored_text('Schema validation passed', '32')}")
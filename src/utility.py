@@ -6,17 +6,274 @@ This module provides utility classes for analyzing font characteristics and proc
 to identify document structure and content characteristics.
 """
 
+import heapq
+import os
 import re
-from typing import Dict, List, Any, Set, Tuple
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional, Sequence, Set, Tuple
+
+# Documents with at least this many spans are classified as a single
+# vectorised NumPy operation
+_NUMPY_MIN_SPANS = 256
+
+# NumPy module, or None when it is not installed; imported on first use since
+# only large documents need it and the import is slow
+_np = None
+_np_loaded = False
+
+def _load_numpy():
+    """
+    Import NumPy on first use.
+
+    Returns:
+        The numpy module, or None when it is not installed.
+    """
+    global _np, _np_loaded
+    if not _np_loaded:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+        _np_loaded = True
+    return _np
+
+# Batches smaller than this are analyzed in-process; below it, starting the
+# worker processes costs more than the analysis itself
+_PARALLEL_MIN_TEXTS = 10000
+
+# Regex patterns are compiled once at import time
+_WS_RE = re.compile(r'\s+')
+
+# Translation table for clean_text: drops control characters and maps smart
+# quotes and dashes to ASCII in a single pass
+_CLEAN_TABLE = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])
+_CLEAN_TABLE.update({
+    0x201c: '"', 0x201d: '"',  # Double quotes
+    0x2018: "'", 0x2019: "'",  # Single quotes
+    0x2013: '-', 0x2014: '-',  # En and em dashes
+})
+
+# Common heading patterns, fused into one alternation so a single match
+# call tests all of them
+_HEADING_ANY = re.compile(
+    r'^(?:'
+    r'\d+\.'  # Numbered sections
+    r'|[A-Z][A-Z\s]*$'  # ALL CAPS
+    r'|[A-Z][a-z]+(?:\s[A-Z][a-z]+)*$'  # Title Case
+    r'|(?:Chapter|Section|Part)\s+\d+'  # Chapter/Section markers
+    r')'
+)
+
+# Only the prefix patterns are tried on texts longer than this; the ALL CAPS
+# and Title Case patterns must scan the whole string and a text this long is
+# a paragraph rather than a heading
+_MAX_HEADING_MATCH_LEN = 120
+_HEADING_PREFIX = re.compile(r'^(?:\d+\.|(?:Chapter|Section|Part)\s+\d+)')
+
+# Heading numbering patterns, fused into one alternation tried in the same
+# order as before; a single match call finds the numbering style
+_NUMBERING = re.compile(
+    r'^(?:'
+    r'(?P<multi>\d+(?:\.\d+)*)'  # Multi-level numbering (e.g., 1. or 1.2.3)
+    r'|(?P<letter>[A-Z])'  # Letter numbering (e.g., A.)
+    r'|(?P<roman>[IVX]+)'  # Roman numerals
+    r')\.\s*(?P<text>.+)$'
+)
+
+_SENT_SPLIT = re.compile(r'[.!?]+')
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# Translation table mapping every ASCII non-word character to a space, so
+# str.split() separates ASCII text into the same word runs _WORD_RE sees
+_ASCII_NON_WORD = str.maketrans({
+    c: ' ' for c in map(chr, range(128)) if not (c.isalnum() or c == '_')
+})
+
+# Words that carry little meaning on their own
+_STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of',
+    'with', 'by', 'from', 'about', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'up', 'down', 'out', 'off',
+    'over', 'under', 'again', 'further', 'then', 'once'
+})
+
+# Text analysis helpers behind the TextProcessor methods; heading texts repeat
+# across pages (running headers, section prefixes), so the heading helpers
+# are memoized on the text itself
+
+def _clean_text(text: str) -> str:
+    """
+    Implementation of TextProcessor.clean_text.
+
+    Args:
+        text: Raw text string to clean.
+
+    Returns:
+        Cleaned text string.
+    """
+    if not text:
+        return ""
+
+    # Remove extra whitespace; whitespace control characters are collapsed
+    # here before the translation below drops the remaining ones
+    text = _WS_RE.sub(' ', text.strip())
+
+    # Remove control characters and normalize quotes and dashes
+    return text.translate(_CLEAN_TABLE)
+
+# clean_text also receives whole pages, so only heading-sized texts are
+# memoized; caching long inputs would keep them alive for the whole run
+_MAX_CACHED_CLEAN_LEN = 200
+_cached_clean_text = lru_cache(maxsize=8192)(_clean_text)
+
+@lru_cache(maxsize=4096)
+def _is_likely_heading(text: str) -> bool:
+    """
+    Cached implementation of TextProcessor.is_likely_heading.
+
+    Args:
+        text: Text to analyze.
+
+    Returns:
+        True if the text is likely a heading.
+    """
+    if not text:
+        return False
+
+    text = text.strip()
+    length = len(text)
+    if length < 3:
+        return False
+
+    # Check for common heading patterns; every pattern starts with a digit or
+    # an uppercase ASCII letter, so other texts skip the regex entirely
+    first = text[0]
+    if first.isdecimal() or 'A' <= first <= 'Z':
+        if length <= _MAX_HEADING_MATCH_LEN:
+            pattern = _HEADING_ANY
+        else:
+            pattern = _HEADING_PREFIX
+        if pattern.match(text):
+            return True
+
+    # Should not end with sentence punctuation; checked before splitting
+    # since it rejects most body text
+    if text[-1] in '.!?':
+        return False
+
+    # Check text characteristics
+    words = text.split()
+
+    # Reasonable length for headings
+    if not (2 <= len(words) <= 12):
+        return False
+
+    # Should not be mostly stop words; stops counting once at least half of
+    # the words are known to be meaningful
+    stop_words = _STOP_WORDS
+    needed = len(words) * 0.5
+    non_stop_count = 0
+    for word in words:
+        if word.lower() not in stop_words:
+            non_stop_count += 1
+            if non_stop_count >= needed:
+                return True
+
+    return False
+
+@lru_cache(maxsize=4096)
+def _extract_numbering(text: str) -> Tuple[Any, str]:
+    """
+    Cached implementation of TextProcessor.extract_numbering.
+
+    Args:
+        text: Heading text to analyze.
+
+    Returns:
+        Tuple of (level, clean_text) where level is the inferred hierarchy level.
+    """
+    match = _NUMBERING.match(text)
+    if not match:
+        return (None, text)
+
+    clean_text = match.group('text')
+
+    # Multi-level numbering (e.g., 1.2.3) nests one level per number;
+    # simple numbering (e.g., 1.) is the single-number case
+    numbering = match.group('multi')
+    if numbering is not None:
+        return (len(numbering.split('.')), clean_text)
+
+    # Letter numbering (e.g., A.)
+    if match.group('letter') is not None:
+        return (2, clean_text)
+
+    # Roman numerals
+    return (1, clean_text)
+
+def _text_complexity(text: str) -> float:
+    """
+    Implementation of TextProcessor.calculate_text_complexity.
+
+    Args:
+        text: Text to analyze.
+
+    Returns:
+        Complexity score (higher = more complex).
+    """
+    if not text:
+        return 0.0
+
+    words = text.split()
+    if not words:
+        return 0.0
+
+    # Calculate average word length
+    avg_word_length = sum(map(len, words)) / len(words)
+
+    # Estimate sentence count from the terminal punctuation marks
+    sentences = text.count('.') + text.count('!') + text.count('?')
+
+    # Calculate words per sentence
+    words_per_sentence = len(words) / max(sentences, 1)
+
+    # Calculate complexity score
+    complexity = (avg_word_length * 0.5) + (words_per_sentence * 0.3)
+
+    return complexity
+
+def _analyze_one(text: str) -> Dict[str, Any]:
+    """
+    Analyze a single text for TextProcessor.process_many.
+
+    Args:
+        text: Text to analyze.
+
+    Returns:
+        Dictionary with the heading, numbering and complexity results for the text.
+    """
+    level, heading_text = _extract_numbering(text)
+    return {
+        'is_heading': _is_likely_heading(text),
+        'level': level,
+        'heading_text': heading_text,
+        'complexity': _text_complexity(text)
+    }
 
 class FontAnalyzer:
     """Analyzes font characteristics to identify document structure."""
 
     def __init__(self):
         """Initialize the font analyzer with a cache for storing font data."""
+        # Interned font names, keyed by name; documents use few distinct fonts
         self.font_cache = {}
 
-    def analyze_font_distribution(self, text_dict: Dict) -> Dict[str, Any]:
+    def analyze_font_distribution(self, text_dict: Dict,
+                                  collect: Iterable[str] = ('sizes', 'names', 'flags')) -> Dict[str, Any]:
         """
         Analyze the distribution of fonts in a document.
 
@@ -25,38 +282,81 @@ class FontAnalyzer:
 
         Args:
             text_dict: A dictionary containing text data from PyMuPDF.
+            collect: Per-span data to collect: any of 'sizes', 'names' and 'flags' (lists in
+                span order) and 'unique_sizes' (a set). Lists that are not needed can be left
+                out to save memory on large documents; the statistics are always computed.
 
         Returns:
-            Dictionary with font analysis results including sizes, names, flags, and statistics.
+            Dictionary with font analysis results including the collected data and statistics.
         """
+        collect = frozenset(collect)
+        collect_sizes = 'sizes' in collect
+        collect_names = 'names' in collect
+        collect_flags = 'flags' in collect
+        collect_unique = 'unique_sizes' in collect
+        font_cache = self.font_cache
+
         font_sizes = []
         font_names = []
         font_flags = []
+        unique_sizes = set()
 
-        if 'blocks' not in text_dict:
-            return {'sizes': [], 'names': [], 'flags': []}
-
-        for block in text_dict['blocks']:
-            if 'lines' not in block:
-                continue
-
-            for line in block['lines']:
-                if 'spans' not in line:
-                    continue
+        # Size statistics are accumulated while collecting the spans
+        span_count = 0
+        total_size = 0
+        min_size = float('inf')
+        max_size = float('-inf')
 
-                for span in line['spans']:
-                    font_sizes.append(span.get('size', 12))
-                    font_names.append(span.get('font', 'default'))
-                    font_flags.append(span.get('flags', 0))
-
-        return {
+        collected = {
             'sizes': font_sizes,
             'names': font_names,
             'flags': font_flags,
-            'avg_size': sum(font_sizes) / len(font_sizes) if font_sizes else 12,
-            'max_size': max(font_sizes) if font_sizes else 12,
-            'min_size': min(font_sizes) if font_sizes else 12
+            'unique_sizes': unique_sizes
         }
+        result = {key: value for key, value in collected.items() if key in collect}
+
+        if 'blocks' not in text_dict:
+            return result
+
+        # Bound methods are looked up once instead of once per span
+        append_size = font_sizes.append
+        append_name = font_names.append
+        append_flags = font_flags.append
+        add_unique = unique_sizes.add
+        get_font = font_cache.get
+
+        for block in text_dict['blocks']:
+            for line in block.get('lines', ()):
+                spans = line.get('spans', ())
+                span_count += len(spans)
+
+                for span in spans:
+                    size = span.get('size', 12)
+                    if collect_sizes:
+                        append_size(size)
+                    if collect_names:
+                        # Share one interned string per font name across spans
+                        name = span.get('font', 'default')
+                        cached_name = get_font(name)
+                        if cached_name is None:
+                            cached_name = font_cache[name] = sys.intern(name)
+                        append_name(cached_name)
+                    if collect_flags:
+                        append_flags(span.get('flags', 0))
+                    if collect_unique:
+                        add_unique(size)
+
+                    total_size += size
+                    if size < min_size:
+                        min_size = size
+                    if size > max_size:
+                        max_size = size
+
+        result['avg_size'] = total_size / span_count if span_count else 12
+        result['max_size'] = max_size if span_count else 12
+        result['min_size'] = min_size if span_count else 12
+
+        return result
 
     def is_heading_font(self, font_size: float, font_flags: int, avg_size: float, threshold: float = 1.2) -> bool:
         """
@@ -82,37 +382,67 @@ class FontAnalyzer:
 
         return is_large or is_bold
 
-    def get_font_hierarchy(self, font_sizes: List[float]) -> Dict[float, int]:
+    def classify_headings(self, font_sizes: Sequence[float], font_flags: Sequence[int],
+                          avg_size: float, threshold: float = 1.2) -> List[bool]:
+        """
+        Apply the heading font test to every span of a document at once.
+
+        Equivalent to calling is_heading_font for each span, but large documents are
+        classified with NumPy instead of one Python call per span.
+
+        Args:
+            font_sizes: Font sizes of the spans, as returned by analyze_font_distribution.
+            font_flags: Font flags of the spans, in the same order.
+            avg_size: Average font size in the document.
+            threshold: Size threshold multiplier to determine if the font is large enough to be a heading.
+
+        Returns:
+            List with True for every span whose font is likely a heading font.
+        """
+        np = _load_numpy() if len(font_sizes) >= _NUMPY_MIN_SPANS else None
+        if np is None:
+            return [
+                self.is_heading_font(size, flags, avg_size, threshold)
+                for size, flags in zip(font_sizes, font_flags)
+            ]
+
+        sizes = np.asarray(font_sizes, dtype=np.float64)
+        flags = np.asarray(font_flags, dtype=np.int64)
+
+        # Same size and boldness checks as is_heading_font, over all spans
+        if avg_size > 0:
+            is_large = sizes / avg_size >= threshold
+        else:
+            is_large = np.full(len(sizes), 1 >= threshold)
+        is_bold = (flags & 2**4) != 0
+
+        return (is_large | is_bold).tolist()
+
+    def get_font_hierarchy(self, font_sizes: Iterable[float]) -> Dict[float, int]:
         """
         Create a hierarchy mapping from font sizes.
 
         This method maps font sizes to hierarchy levels, which can be used to infer document structure.
 
         Args:
-            font_sizes: List of font sizes found in the document.
+            font_sizes: Font sizes found in the document; a set (such as the 'unique_sizes'
+                collected by analyze_font_distribution) is used as is.
 
         Returns:
             Dictionary mapping font size to hierarchy level (1=largest, 2=second, etc.).
         """
-        unique_sizes = sorted(set(font_sizes), reverse=True)
-        hierarchy = {}
-
-        for i, size in enumerate(unique_sizes[:3]):  # Only consider top 3 levels
-            hierarchy[size] = i + 1
+        if not isinstance(font_sizes, (set, frozenset)):
+            font_sizes = set(font_sizes)
 
-        return hierarchy
+        # Only consider top 3 levels; a heap avoids sorting every distinct size
+        return {size: i + 1 for i, size in enumerate(heapq.nlargest(3, font_sizes))}
 
 class TextProcessor:
     """Processes and analyzes text content for structure detection."""
 
     def __init__(self):
         """Initialize the text processor with a set of stop words."""
-        self.stop_words = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of',
-            'with', 'by', 'from', 'about', 'into', 'through', 'during',
-            'before', 'after', 'above', 'below', 'up', 'down', 'out', 'off',
-            'over', 'under', 'again', 'further', 'then', 'once'
-        }
+        self.stop_words = _STOP_WORDS
 
     def clean_text(self, text: str) -> str:
         """
@@ -126,21 +456,9 @@ class TextProcessor:
         Returns:
             Cleaned text string.
         """
-        if not text:
-            return ""
-
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-
-        # Remove control characters
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-
-        # Normalize quotes and dashes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace("'", "'").replace("'", "'")
-        text = text.replace('–', '-').replace('—', '-')
-
-        return text
+        if text and len(text) <= _MAX_CACHED_CLEAN_LEN:
+            return _cached_clean_text(text)
+        return _clean_text(text)
 
     def is_likely_heading(self, text: str) -> bool:
         """
@@ -154,40 +472,7 @@ class TextProcessor:
         Returns:
             True if the text is likely a heading.
         """
-        if not text or len(text.strip()) < 3:
-            return False
-
-        text = text.strip()
-
-        # Check for common heading patterns
-        heading_patterns = [
-            r'^\d+\.',  # Numbered sections
-            r'^[A-Z][A-Z\s]*$',  # ALL CAPS
-            r'^[A-Z][a-z]+(\s[A-Z][a-z]+)*$',  # Title Case
-            r'^(Chapter|Section|Part)\s+\d+',  # Chapter/Section markers
-        ]
-
-        for pattern in heading_patterns:
-            if re.match(pattern, text):
-                return True
-
-        # Check text characteristics
-        words = text.split()
-
-        # Reasonable length for headings
-        if not (2 <= len(words) <= 12):
-            return False
-
-        # Should not end with sentence punctuation
-        if text.endswith(('.', '!', '?')):
-            return False
-
-        # Should not be mostly stop words
-        non_stop_words = [w for w in words if w.lower() not in self.stop_words]
-        if len(non_stop_words) < len(words) * 0.5:
-            return False
-
-        return True
+        return _is_likely_heading(text)
 
     def extract_numbering(self, text: str) -> Tuple[Any, str]:
         """
@@ -201,33 +486,7 @@ class TextProcessor:
         Returns:
             Tuple of (level, clean_text) where level is the inferred hierarchy level.
         """
-        # Pattern for multi-level numbering (e.g., 1.2.3)
-        match = re.match(r'^(\d+(?:\.\d+)*)\.\s*(.+)$', text)
-        if match:
-            numbering = match.group(1)
-            clean_text = match.group(2)
-            level = len(numbering.split('.'))
-            return (level, clean_text)
-
-        # Pattern for simple numbering (e.g., 1.)
-        match = re.match(r'^(\d+)\.\s*(.+)$', text)
-        if match:
-            clean_text = match.group(2)
-            return (1, clean_text)
-
-        # Pattern for letter numbering (e.g., A.)
-        match = re.match(r'^([A-Z])\.\s*(.+)$', text)
-        if match:
-            clean_text = match.group(2)
-            return (2, clean_text)
-
-        # Pattern for Roman numerals
-        match = re.match(r'^([IVX]+)\.\s*(.+)$', text)
-        if match:
-            clean_text = match.group(2)
-            return (1, clean_text)
-
-        return (None, text)
+        return _extract_numbering(text)
 
     def calculate_text_complexity(self, text: str) -> float:
         """
@@ -241,26 +500,7 @@ class TextProcessor:
         Returns:
             Complexity score (higher = more complex).
         """
-        if not text:
-            return 0.0
-
-        words = text.split()
-        if not words:
-            return 0.0
-
-        # Calculate average word length
-        avg_word_length = sum(len(word) for word in words) / len(words)
-
-        # Estimate sentence count
-        sentences = len(re.split(r'[.!?]+', text))
-
-        # Calculate words per sentence
-        words_per_sentence = len(words) / max(sentences, 1)
-
-        # Calculate complexity score
-        complexity = (avg_word_length * 0.5) + (words_per_sentence * 0.3)
-
-        return complexity
+        return _text_complexity(text)
 
     def split_into_sentences(self, text: str) -> List[str]:
         """
@@ -278,7 +518,7 @@ class TextProcessor:
             return []
 
         # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENT_SPLIT.split(text)
 
         # Clean and filter sentences
         cleaned_sentences = []
@@ -305,18 +545,44 @@ class TextProcessor:
         if not text:
             return []
 
-        # Convert to lowercase and split into words
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+        # Convert to lowercase and split into words; plain ASCII tokens are
+        # already whole word runs, only tokens with other characters need the
+        # regex to find their word boundaries
+        words = []
+        for token in text.lower().translate(_ASCII_NON_WORD).split():
+            if token.isascii():
+                if len(token) >= 3 and token.isalpha():
+                    words.append(token)
+            else:
+                words.extend(_WORD_RE.findall(token))
+
+        # Count word frequencies, skipping stop words
+        stop_words = self.stop_words
+        word_freq = Counter(word for word in words if word not in stop_words)
+
+        # Return the top k; ties keep their first-seen order
+        return [word for word, freq in word_freq.most_common(top_k)]
+
+    def process_many(self, texts: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze many independent texts, in parallel for large batches.
 
-        # Remove stop words
-        words = [word for word in words if word not in self.stop_words]
+        Each text is run through is_likely_heading, extract_numbering and
+        calculate_text_complexity. Large batches are spread over a process pool.
 
-        # Count word frequencies
-        word_freq = {}
-        for word in words:
-            word_freq[word] = word_freq.get(word, 0) + 1
+        Args:
+            texts: Texts to analyze, such as the spans or lines of a document.
+            max_workers: Number of worker processes; defaults to the CPU count.
 
-        # Sort by frequency and return top k
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+        Returns:
+            One analysis dictionary per text, in input order, with the keys
+            'is_heading', 'level', 'heading_text' (the text left once extract_numbering
+            strips its numbering) and 'complexity'.
+        """
+        if len(texts) < _PARALLEL_MIN_TEXTS:
+            return [_analyze_one(text) for text in texts]
 
-        return [word for word, freq in sorted_words[:top_k]]
+        # Work is shipped to module-level functions, so only the texts are pickled
+        max_workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_analyze_one, texts, chunksize=64))
@@ -7,10 +7,14 @@ to ensure they adhere to the structure required by the Challenge 1A of the hacka
 """
 
 import json
+import sys
 import jsonschema
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
+# ANSI colors are only emitted when writing to a terminal
+_IS_TTY = sys.stdout.isatty()
+
 def colored_text(text: str, color_code: str) -> str:
     """
     Return colored text for terminal output using ANSI escape codes.
@@ -20,8 +24,11 @@ def colored_text(text: str, color_code: str) -> str:
         color_code: ANSI color code to apply to the text.
 
     Returns:
-        String with ANSI color codes applied for terminal output.
+        String with ANSI color codes applied for terminal output, or the plain text
+        when output is not a terminal.
     """
+    if not _IS_TTY:
+        return text
     return f"\033[{color_code}m{text}\033[0m"
 
 class SchemaValidator:
@@ -269,32 +276,35 @@ def validate_output_directory(output_dir: Path) -> None:
         print("No JSON files found in output directory.")
         return
 
-    print(f"{colored_text('Validating', '36')} {len(json_files)} JSON file(s)...")
-    print("=" * 70)
+    # Per-file lines go straight to the stdout buffer; it is flushed once at the end
+    write = sys.stdout.write
+    write(f"{colored_text('Validating', '36')} {len(json_files)} JSON file(s)...\n")
+    write("=" * 70 + "\n")
 
     valid_count = 0
 
     for json_file in json_files:
-        print(f"\n{colored_text('Checking:', '34')} {json_file.name}")
+        write(f"\n{colored_text('Checking:', '34')} {json_file.name}\n")
         is_valid, errors = validator.validate_json_file(json_file)
 
         if is_valid:
-            print(f"   {colored_text('Valid', '32')}")
+            write(f"   {colored_text('Valid', '32')}\n")
             valid_count += 1
         else:
-            print(f"   {colored_text('Invalid', '31')}")
+            write(f"   {colored_text('Invalid', '31')}\n")
             for error in errors[:3]:  # Show first 3 errors
-                print(f"      - {error}")
+                write(f"      - {error}\n")
             if len(errors) > 3:
-                print(f"      ... and {len(errors) - 3} more error(s)")
+                write(f"      ... and {len(errors) - 3} more error(s)\n")
 
-    print(f"\n{'=' * 70}")
-    print(f"{colored_text('Summary:', '34')} {valid_count}/{len(json_files)} files passed validation")
+    write(f"\n{'=' * 70}\n")
+    write(f"{colored_text('Summary:', '34')} {valid_count}/{len(json_files)} files passed validation\n")
 
     if valid_count == len(json_files):
-        print(f"{colored_text('All files conform to the official schema!', '32')}")
+        write(f"{colored_text('All files conform to the official schema!', '32')}\n")
     else:
-        print(f"{colored_text(f'{len(json_files) - valid_count} file(s) need fixing', '33')}")
+        write(f"{colored_text(f'{len(json_files) - valid_count} file(s) need fixing', '33')}\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     # Validate the output directory
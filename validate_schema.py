@@ -7,10 +7,17 @@ This script validates Challenge 1A output files against the official schema.
 It checks JSON files in a specified directory to ensure they conform to the expected structure.
 """
 
+import importlib.util
 import json
 import sys
 from pathlib import Path
 
+# ANSI colors are only emitted when writing to a terminal
+_IS_TTY = sys.stdout.isatty()
+
+# Decorative bar framing the header
+_BAR = "✨" * 50
+
 def colored_text(text: str, color_code: str) -> str:
     """
     Return colored text for terminal output using ANSI escape codes.
@@ -20,8 +27,11 @@ def colored_text(text: str, color_code: str) -> str:
         color_code: ANSI color code to apply to the text.
 
     Returns:
-        String with ANSI color codes applied for terminal output.
+        String with ANSI color codes applied for terminal output, or the plain text
+        when output is not a terminal.
     """
+    if not _IS_TTY:
+        return text
     return f"\033[{color_code}m{text}\033[0m"
 
 def print_header(text: str) -> None:
@@ -31,9 +41,7 @@ def print_header(text: str) -> None:
     Args:
         text: The header text to display.
     """
-    print("\n" + "✨" * 50)
-    print(f"🌟 {text}")
-    print("✨" * 50 + "\n")
+    sys.stdout.write(f"\n{_BAR}\n🌟 {text}\n{_BAR}\n\n")
 
 def print_error(message: str) -> None:
     """
@@ -42,7 +50,7 @@ def print_error(message: str) -> None:
     Args:
         message: The error message to display.
     """
-    print(f"❌ {colored_text(message, '31')}")
+    sys.stdout.write(f"❌ {colored_text(message, '31')}\n")
 
 def print_info(message: str) -> None:
     """
@@ -51,7 +59,7 @@ def print_info(message: str) -> None:
     Args:
         message: The informational message to display.
     """
-    print(f"ℹ️ {message}")
+    sys.stdout.write(f"ℹ️ {message}\n")
 
 def main():
     """
@@ -72,11 +80,20 @@ def main():
         print_info("Please ensure you have an 'output' directory with JSON files.")
         sys.exit(1)
 
+    # Locate the validator module first so a wrong working directory fails fast,
+    # without importing the package; the parent must be checked on its own since
+    # find_spec raises instead of returning None when it is missing
+    if (importlib.util.find_spec('src') is None
+            or importlib.util.find_spec('src.validate_schema') is None):
+        print_error("Error: Could not import schema_validator module")
+        print_info("Make sure you're running this from the Challenge_1a directory")
+        sys.exit(1)
+
     try:
         # Attempt to import the SchemaValidator and related functions
         from src.validate_schema import SchemaValidator, validate_output_directory
     except ImportError:
-        # Handle import errors gracefully
+        # Handle import errors gracefully, e.g. a missing jsonschema dependency
         print_error("Error: Could not import schema_validator module")
         print_info("Make sure you're running this from the Challenge_1a directory")
         sys.exit(1)
@@ -85,6 +102,7 @@ def main():
     print_info("Starting validation process...")
     validate_output_directory(output_dir)
     print_info("Validation process completed.")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     # Execute the main function when the script is run directly